@@ -1,7 +1,39 @@
+import functools
+import math
 import numpy as np
 import random
 import time
 
+try:
+    from scipy.linalg import blas, lapack
+except ImportError:  # SciPy is optional; numpy.linalg is used when it is missing
+    blas = lapack = None
+
+try:
+    import numba
+except ImportError:  # Numba is optional; the pure NumPy paths are used when it is missing
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _synchronize_arrival_times(coords, threshold):
+        """
+        Compiled arrival-time synchronization: times deviating from the mean by more
+        than threshold snap to the mean, using a branchless select.
+        """
+        n = coords.shape[0]
+        times = np.empty(n)
+        total = 0.0
+        for i in numba.prange(n):
+            times[i] = math.sqrt(coords[i, 0] * coords[i, 0] + coords[i, 1] * coords[i, 1] + coords[i, 2] * coords[i, 2]) / 10.0
+            total += times[i]
+        avg = total / n
+        for i in numba.prange(n):
+            delta = times[i] - avg
+            keep = 1.0 if abs(delta) <= threshold else 0.0
+            times[i] = avg + delta * keep
+        return times
+
 # ------------------------------
 # FragmentAlignment: Directional Fragmentation Alignment with Synchronization & Priority Weighting
 # ------------------------------
@@ -15,27 +47,198 @@ class FragmentAlignment:
                 - direction: string representing origin direction
                 - priority: numeric value; higher means more important
         """
-        self.fragments = fragments
+        # Structure-of-arrays layout: coordinates and priorities live in contiguous
+        # arrays so distance computations and sorting run as vectorized passes.
+        # Directions take no part in the math and are kept in their own array.
+        self.coords = np.asarray([f[0] for f in fragments], dtype=np.float64).reshape(len(fragments), 3)
+        self.direction = np.asarray([f[1] for f in fragments], dtype=str)
+        self.priority = np.asarray([f[2] for f in fragments], dtype=np.float64)
+        # The caller's tuples and the current permutation of them, so as_tuples() can
+        # hand back the original values (e.g. int coordinates) rather than float casts.
+        self._fragments = list(fragments)
+        self._order = np.arange(len(self._fragments))
+
+    def as_tuples(self):
+        """
+        Returns the fragments as the caller's original (coordinates, direction, priority)
+        tuples, in their current order.
+        """
+        return [self._fragments[i] for i in self._order.tolist()]
+
+    def _squared_distances(self):
+        """
+        Returns the squared distance of every fragment from the origin.
+        """
+        return np.einsum('ij,ij->i', self.coords, self.coords)
 
     def align_fragments(self):
         """
         Aligns fragments in a symmetrical order based on distance and priority.
-        Fragments are sorted by (distance from origin, -priority).
+        Fragments are sorted by (distance from origin, -priority). The squared
+        distance is used as the key since it yields the same order without a sqrt.
+        Returns the aligned fragments as a list of tuples (see as_tuples()).
         """
-        self.fragments.sort(key=lambda f: (np.linalg.norm(f[0]), -f[2]))
-        return self.fragments
+        order = np.lexsort((-self.priority, self._squared_distances()))
+        self.coords = self.coords[order]
+        self.direction = self.direction[order]
+        self.priority = self.priority[order]
+        self._order = self._order[order]
+        return self.as_tuples()
 
     def synchronize_fragments(self, time_sync_threshold=0.05):
         """
         Simulates synchronization by calculating 'arrival times' based on distance.
         Adjusts times deviating from the average by more than the threshold.
-        Returns a list of corrected arrival times.
+        Returns an array of corrected arrival times.
         """
-        arrival_times = [np.linalg.norm(f[0]) / 10.0 for f in self.fragments]  # Simulated arrival times
-        avg_time = sum(arrival_times) / len(arrival_times)
-        corrected_times = [t if abs(t - avg_time) <= time_sync_threshold else avg_time for t in arrival_times]
+        if self.coords.shape[0] == 0:
+            return np.empty(0)
+        if numba is not None:
+            return _synchronize_arrival_times(self.coords, time_sync_threshold)
+        arrival_times = np.sqrt(self._squared_distances()) / 10.0  # Simulated arrival times
+        avg_time = arrival_times.mean()
+        corrected_times = np.where(np.abs(arrival_times - avg_time) <= time_sync_threshold, arrival_times, avg_time)
         return corrected_times
 
+# ------------------------------
+# LAPACK Workspace Cache: Bound Routines & Workspace Sizes Reused per Matrix Shape
+# ------------------------------
+@functools.lru_cache(maxsize=None)
+def _gesdd_workspace(shape, dtype):
+    """
+    Binds gesdd for the dtype and queries its workspace size once per shape.
+    """
+    gesdd, gesdd_lwork = lapack.get_lapack_funcs(('gesdd', 'gesdd_lwork'), dtype=dtype)
+    work, _ = gesdd_lwork(*shape, compute_uv=1, full_matrices=0)
+    return gesdd, int(work)
+
+@functools.lru_cache(maxsize=None)
+def _qr_multiply_workspace(a_shape, c_shape, dtype):
+    """
+    Binds geqrf/ormqr for the dtype and queries their workspace sizes once per shape pair.
+    """
+    geqrf, ormqr = lapack.get_lapack_funcs(('geqrf', 'ormqr'), dtype=dtype)
+    dummy_a = np.zeros(a_shape, dtype=dtype, order='F')
+    dummy_c = np.zeros(c_shape, dtype=dtype, order='F')
+    _, tau, work, _ = geqrf(dummy_a, lwork=-1)
+    geqrf_lwork = int(work[0].real)
+    _, work, _ = ormqr('L', 'N', dummy_a, tau, dummy_c, -1)
+    return geqrf, ormqr, geqrf_lwork, int(work[0].real)
+
+# Bound once so small products skip both np.dot's dispatch and the attribute lookup.
+_dgemm = blas.dgemm if blas is not None else None
+
+def _matmul(a, b, trans_a=False, trans_b=False):
+    """
+    Product op(a) @ op(b) of float64 matrices, calling BLAS dgemm directly when SciPy is available.
+    """
+    if _dgemm is None:
+        return (a.T if trans_a else a) @ (b.T if trans_b else b)
+    return _dgemm(1.0, a, b, trans_a=trans_a, trans_b=trans_b)
+
+def _svd(a):
+    """
+    Reduced SVD returning (u, s, vh), reusing cached LAPACK workspace.
+    """
+    if lapack is None:
+        return np.linalg.svd(a, full_matrices=False)
+    gesdd, lwork = _gesdd_workspace(a.shape, a.dtype)
+    u, s, vh, info = gesdd(np.array(a, order='F'), compute_uv=1, full_matrices=0, lwork=lwork, overwrite_a=1)
+    if info != 0:
+        raise np.linalg.LinAlgError("SVD did not converge")
+    return u, s, vh
+
+def _qr_multiply(a, c, positive_r=False, overwrite_a=False):
+    """
+    Computes Q @ c for the QR decomposition of a by applying the Householder
+    reflectors directly to c, without ever forming Q.
+    With positive_r, Q is sign-normalized so that diag(R) > 0, which makes Q
+    Haar-distributed when a has i.i.d. standard normal entries.
+    With overwrite_a, a float64 Fortran-ordered a is factorized in place.
+    """
+    if lapack is None:
+        q, r = np.linalg.qr(a)
+        if positive_r:
+            q = q * np.sign(np.diagonal(r))
+        return q @ c
+    dtype = np.result_type(a, c, np.float64)
+    a = np.asarray(a, dtype=dtype, order='F') if overwrite_a else np.array(a, dtype=dtype, order='F')
+    # ormqr works on a (d, k) block; a 1-D c is treated as a single column
+    c_shape = np.shape(c)
+    c = np.array(c, dtype=dtype, order='F').reshape(c_shape[0], -1, order='F')
+    geqrf, ormqr, geqrf_lwork, ormqr_lwork = _qr_multiply_workspace(a.shape, c.shape, dtype)
+    qr, tau, _, info = geqrf(a, lwork=geqrf_lwork, overwrite_a=1)
+    if info != 0:
+        raise np.linalg.LinAlgError("QR decomposition failed")
+    if positive_r:
+        # Q diag(s) @ c == Q @ (diag(s) c), so the sign fix folds into the rows of c
+        c *= np.sign(np.diagonal(qr))[:c.shape[0], None]
+    cq, _, info = ormqr('L', 'N', qr, tau, c, ormqr_lwork, overwrite_c=1)
+    if info != 0:
+        raise np.linalg.LinAlgError("Applying QR reflectors failed")
+    return cq.reshape(c_shape, order='F')
+
+if numba is not None:
+    def _make_small_svd(n):
+        """
+        Builds an SVD kernel for n x n matrices using one-sided Jacobi rotations.
+        n is a compile-time constant of the kernel, so every inner loop has a fixed
+        trip count that LLVM fully unrolls. Singular values are returned unsorted.
+        """
+        @numba.njit(cache=True)
+        def svd(matrix):
+            a = matrix.copy()
+            v = np.eye(n)
+            tol = n * 2.220446049250313e-16
+            for _ in range(30):
+                rotated = False
+                for p in range(n - 1):
+                    for q in range(p + 1, n):
+                        alpha = 0.0
+                        beta = 0.0
+                        gamma = 0.0
+                        for i in range(n):
+                            alpha += a[i, p] * a[i, p]
+                            beta += a[i, q] * a[i, q]
+                            gamma += a[i, p] * a[i, q]
+                        if abs(gamma) <= tol * math.sqrt(alpha * beta):
+                            continue
+                        rotated = True
+                        # Rotation that makes columns p and q orthogonal
+                        zeta = (beta - alpha) / (2.0 * gamma)
+                        t = math.copysign(1.0, zeta) / (abs(zeta) + math.sqrt(1.0 + zeta * zeta))
+                        c = 1.0 / math.sqrt(1.0 + t * t)
+                        s = c * t
+                        for i in range(n):
+                            ap = a[i, p]
+                            aq = a[i, q]
+                            a[i, p] = c * ap - s * aq
+                            a[i, q] = s * ap + c * aq
+                            vp = v[i, p]
+                            vq = v[i, q]
+                            v[i, p] = c * vp - s * vq
+                            v[i, q] = s * vp + c * vq
+                if not rotated:
+                    break
+            # Columns of a are now U scaled by the singular values
+            sigma = np.empty(n)
+            for k in range(n):
+                norm2 = 0.0
+                for i in range(n):
+                    norm2 += a[i, k] * a[i, k]
+                sigma[k] = math.sqrt(norm2)
+                if sigma[k] > 0.0:
+                    for i in range(n):
+                        a[i, k] /= sigma[k]
+            return a, sigma, v.T
+
+        return svd
+
+    # Specialized kernels for the small fixed shapes used throughout AngelNET
+    _SMALL_SVD = {n: _make_small_svd(n) for n in (3, 4)}
+else:
+    _SMALL_SVD = {}
+
 # ------------------------------
 # ProjectionAxisCorrection: Projection Axis Correction with Error Detection & Auto-Correction
 # ------------------------------
@@ -59,12 +262,20 @@ class ProjectionAxisCorrection:
 
     def correct_axis(self):
         """
-        Corrects the projection axis using SVD to orthogonalize the transformation matrix.
+        Corrects the projection axis by replacing the transformation matrix with its
+        closest orthogonal matrix, the polar factor U Vᴴ of its SVD.
         Returns the corrected projection matrix.
         """
         self.detect_errors()
-        u, _, vh = np.linalg.svd(self.projection_matrix)
-        corrected_matrix = np.dot(u, vh)
+        matrix = np.asarray(self.projection_matrix, dtype=np.float64)
+        small_svd = _SMALL_SVD.get(matrix.shape[0]) if matrix.shape[0] == matrix.shape[1] else None
+        if small_svd is not None:
+            u, s, vh = small_svd(matrix)
+            # A zero singular value leaves its U column undefined; let the LAPACK SVD handle it
+            if s.min() > np.finfo(np.float64).eps * s.max():
+                return _matmul(u, vh)
+        u, _, vh = _svd(matrix)
+        corrected_matrix = _matmul(u, vh)
         return corrected_matrix
 
 # ------------------------------
@@ -83,14 +294,13 @@ class HighDimensionalProjection:
 
     def enhance_projection(self):
         """
-        Enhances the high-dimensional projection by normalizing the tensor.
+        Enhances the high-dimensional projection by normalizing the tensor in place.
         Returns the normalized tensor.
         """
-        tensor_norm = np.linalg.norm(self.projection_tensor)
-        if tensor_norm == 0:
-            tensor_norm = 1
-        enhanced_tensor = self.projection_tensor / tensor_norm
-        return enhanced_tensor
+        squared_norm = np.einsum('ijk,ijk->', self.projection_tensor, self.projection_tensor)
+        scale = 1.0 / math.sqrt(squared_norm) if squared_norm > 0 else 1.0
+        self.projection_tensor *= scale
+        return self.projection_tensor
 
 # ------------------------------
 # AIProjectionOptimizer: Future Expansion for AI Projection Optimization
@@ -103,29 +313,78 @@ class AIProjectionOptimizer:
         """
         pass
 
-    def optimize(self, projection_matrix):
+    def optimize(self, projection_matrix, inplace=False):
         """
         Simulates optimization by applying a small corrective adjustment.
         Args:
             projection_matrix (numpy array): The projection matrix to optimize.
+            inplace (bool): Apply the adjustment to projection_matrix itself instead of a copy.
+                Requires a floating-point projection_matrix, whose dtype is kept.
+                Otherwise the copy is promoted to at least float64.
         Returns:
             numpy array: The optimized projection matrix.
+        Raises:
+            TypeError: If inplace is set and projection_matrix does not have a floating-point dtype.
         """
-        correction = np.eye(projection_matrix.shape[0]) * 0.01  # Small identity correction
-        optimized_matrix = projection_matrix + correction
+        if inplace:
+            if projection_matrix.dtype.kind not in 'fc':
+                raise TypeError("inplace optimization requires a floating-point projection matrix")
+            optimized_matrix = projection_matrix
+        else:
+            # Same promotion as adding a float64 identity: float16/float32/int inputs become float64
+            dtype = projection_matrix.dtype
+            optimized_matrix = projection_matrix.copy() if dtype == np.float64 else projection_matrix.astype(np.result_type(dtype, np.float64))
+        # Small identity correction, applied to the diagonal only: in the flattened matrix the
+        # diagonal entries are every (columns + 1)-th element, up to the last diagonal row
+        columns = optimized_matrix.shape[1]
+        optimized_matrix.flat[:min(optimized_matrix.shape) * columns:columns + 1] += 0.01
         return optimized_matrix
 
 # ------------------------------
 # QuantumSyncedProjection: Future Expansion for Quantum-Synced Projection
 # ------------------------------
+def _jax_batched_sync():
+    """
+    Builds a jitted, vmapped JAX version of the batched sync when JAX is importable
+    and a GPU/TPU backend is available. Returns None otherwise.
+    """
+    try:
+        import jax
+        import jax.numpy as jnp
+    except ImportError:
+        return None
+    try:
+        from jax import enable_x64
+    except ImportError:  # Older JAX releases only ship the context manager under jax.experimental
+        from jax.experimental import enable_x64
+    if jax.default_backend() == 'cpu':
+        return None
+
+    def sync_one(random_matrix, projection_matrix):
+        q, r = jnp.linalg.qr(random_matrix)
+        return (q * jnp.sign(jnp.diagonal(r))) @ projection_matrix
+
+    batched_sync = jax.jit(jax.vmap(sync_one))
+
+    def sync(random_matrices, projection_matrices):
+        # Without x64 JAX silently downcasts float64 inputs to float32; enable it for this call only
+        with enable_x64(True):
+            return np.asarray(batched_sync(random_matrices, projection_matrices))
+
+    return sync
+
 class QuantumSyncedProjection:
-    def __init__(self, qubits=4):
+    def __init__(self, qubits=4, use_jax=False):
         """
         Simulates quantum-synced projection.
         Args:
             qubits (int): Number of qubits for simulation.
+            use_jax (bool): Route batched syncs through JAX when a GPU/TPU backend is available.
         """
         self.qubits = qubits
+        self._jax_sync = _jax_batched_sync() if use_jax else None
+        self._rng = np.random.default_rng()
+        self._buffer = None  # Reused (d, d) random matrix, allocated on first sync
 
     def sync_projection(self, projection_matrix):
         """
@@ -135,12 +394,33 @@ class QuantumSyncedProjection:
         Returns:
             numpy array: The quantum-synced projection matrix.
         """
-        random_matrix = np.random.rand(projection_matrix.shape[0], projection_matrix.shape[0])
-        # Use QR decomposition to obtain an orthogonal matrix.
-        q, _ = np.linalg.qr(random_matrix)
-        synced_matrix = np.dot(q, projection_matrix)
+        d = projection_matrix.shape[0]
+        if self._buffer is None or self._buffer.shape != (d, d):
+            self._buffer = np.empty((d, d), order='F')
+        # Standard normal entries plus a positive-diagonal R give a Haar-uniform rotation.
+        self._rng.standard_normal(out=self._buffer)
+        # Rotate by the orthogonal QR factor of the random matrix without materializing it.
+        synced_matrix = _qr_multiply(self._buffer, projection_matrix, positive_r=True, overwrite_a=True)
         return synced_matrix
 
+    def sync_projection_batch(self, projection_matrices):
+        """
+        Synchronizes a stack of projection matrices, each with its own random orthogonal rotation.
+        All QR decompositions run as one stacked call.
+        Args:
+            projection_matrices (numpy array): Stack of matrices with shape (B, d, k).
+        Returns:
+            numpy array: The quantum-synced matrices with shape (B, d, k).
+        """
+        projection_matrices = np.asarray(projection_matrices)
+        batch, d = projection_matrices.shape[:2]
+        random_matrices = self._rng.standard_normal((batch, d, d))
+        if self._jax_sync is not None:
+            return self._jax_sync(random_matrices, projection_matrices)
+        q, r = np.linalg.qr(random_matrices)
+        q *= np.sign(np.diagonal(r, axis1=-2, axis2=-1))[:, None, :]
+        return q @ projection_matrices
+
 # ------------------------------
 # Main Execution: Integrating All Features for AngelNET
 # ------------------------------
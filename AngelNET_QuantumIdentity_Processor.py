@@ -1,7 +1,12 @@
 using System;
+using System.Buffers;
 using System.Linq;
+using System.Numerics;
+using System.Runtime.InteropServices;
 using System.Security.Cryptography;
 using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
 
 namespace AngelNET
 {
@@ -10,6 +15,7 @@ namespace AngelNET
     // ------------------------------
     public class SignatureDefragmentation
     {
+        private const int DigestSize = 32;  // SHA-256 digest length in bytes
         private string[] fragments;
 
         public SignatureDefragmentation(string[] fragments)
@@ -19,17 +25,44 @@ namespace AngelNET
 
         public string Reconstruct()
         {
-            // Align and reconstruct fragmented identity layers
-            return string.Concat(fragments.OrderBy(x => BitConverter.ToString(SHA256.Create().ComputeHash(Encoding.UTF8.GetBytes(x)))));
+            // Align and reconstruct fragmented identity layers, hashing each fragment once
+            // into its own fixed 32-byte window of a shared digest buffer
+            byte[] digests = new byte[fragments.Length * DigestSize];
+            int maxLength = fragments.Length == 0 ? 0 : fragments.Max(f => f.Length);
+            byte[] encoded = ArrayPool<byte>.Shared.Rent(Encoding.UTF8.GetMaxByteCount(maxLength));
+            try
+            {
+                for (int i = 0; i < fragments.Length; i++)
+                {
+                    int byteCount = Encoding.UTF8.GetBytes(fragments[i].AsSpan(), encoded);
+                    SHA256.HashData(encoded.AsSpan(0, byteCount), digests.AsSpan(i * DigestSize, DigestSize));
+                }
+            }
+            finally
+            {
+                ArrayPool<byte>.Shared.Return(encoded, clearArray: true);
+            }
+
+            int[] order = Enumerable.Range(0, fragments.Length).ToArray();
+            Array.Sort(order, (a, b) => digests.AsSpan(a * DigestSize, DigestSize).SequenceCompareTo(digests.AsSpan(b * DigestSize, DigestSize)));
+            return string.Concat(order.Select(i => fragments[i]));
         }
 
         public string Verify(string signature)
         {
             // Verifies signature integrity via hashing
-            using (SHA256 sha256Hash = SHA256.Create())
+            Span<byte> digest = stackalloc byte[DigestSize];
+            byte[] encoded = ArrayPool<byte>.Shared.Rent(Encoding.UTF8.GetMaxByteCount(signature.Length));
+            try
+            {
+                int byteCount = Encoding.UTF8.GetBytes(signature.AsSpan(), encoded);
+                SHA256.HashData(encoded.AsSpan(0, byteCount), digest);
+            }
+            finally
             {
-                return BitConverter.ToString(sha256Hash.ComputeHash(Encoding.UTF8.GetBytes(signature)));
+                ArrayPool<byte>.Shared.Return(encoded, clearArray: true);
             }
+            return Convert.ToHexString(digest);
         }
     }
 
@@ -51,22 +84,39 @@ namespace AngelNET
 
         public double[] Forward(double[] input)
         {
-            // Handle N-dimensional input
-            if (input.Length > 2) // Check for N-dimensional input
+            // N-dimensional input arrives already flattened as double[], so it is read in place
+            if (input.Length == 0 && outputSize > 0)
             {
-                // Flatten input to fit a classical neural network
-                input = input.Select(x => (double)x).ToArray();
+                throw new ArgumentException("Input must contain at least one value.", nameof(input));
             }
 
-            // Simulate classical neural processing (placeholder for actual neural network)
+            // Simulate classical neural processing (placeholder for actual neural network).
+            // The output cycles through the input, so process it as contiguous tiles of input.Length.
             double[] output = new double[outputSize];
-            for (int i = 0; i < outputSize; i++)
+            for (int start = 0; start < outputSize; start += input.Length)
             {
-                output[i] = input[i % input.Length] * 0.5 + 0.3;  // Placeholder transformation
+                int count = Math.Min(input.Length, outputSize - start);
+                MultiplyAdd(input.AsSpan(0, count), 0.5, 0.3, output.AsSpan(start, count));  // Placeholder transformation
             }
             return output;
         }
 
+        private static void MultiplyAdd(ReadOnlySpan<double> x, double scale, double shift, Span<double> destination)
+        {
+            // destination[i] = x[i] * scale + shift, Vector<double> lanes at a time with a scalar tail
+            var scaleVector = new Vector<double>(scale);
+            var shiftVector = new Vector<double>(shift);
+            int i = 0;
+            for (; i <= x.Length - Vector<double>.Count; i += Vector<double>.Count)
+            {
+                (new Vector<double>(x.Slice(i)) * scaleVector + shiftVector).CopyTo(destination.Slice(i));
+            }
+            for (; i < x.Length; i++)
+            {
+                destination[i] = x[i] * scale + shift;
+            }
+        }
+
         public double[] QuantumProcess(int qubits = 3)
         {
             // Simulating quantum entanglement processing (simplified)
@@ -95,8 +145,15 @@ namespace AngelNET
 
         public bool VerifyProof(string proof, string expectedHash)
         {
-            // Verifies zk-SNARK proof without exposing identity data
-            return proof.Contains(expectedHash);
+            // Verifies zk-SNARK proof without exposing identity data.
+            // The hash is the last '-'-separated field of "Proof-{key}-{hash}"; compare it in constant time.
+            int separator = proof.LastIndexOf('-');
+            if (separator < 0)
+            {
+                return false;
+            }
+            ReadOnlySpan<char> actualHash = proof.AsSpan(separator + 1);
+            return CryptographicOperations.FixedTimeEquals(MemoryMarshal.AsBytes(actualHash), MemoryMarshal.AsBytes(expectedHash.AsSpan()));
         }
     }
 
@@ -106,65 +163,155 @@ namespace AngelNET
     public class HolographicInstantiator
     {
         private int dim;
-        private double[,] projectionMatrix;
+        private double[] projectionMatrix;  // Row-major dim x dim, row i at [i * dim, (i + 1) * dim)
 
         public HolographicInstantiator(int dim = 3)
         {
             this.dim = dim;
-            this.projectionMatrix = new double[dim, dim];
-            Random rand = new Random();
-            for (int i = 0; i < dim; i++)
+            this.projectionMatrix = new double[dim * dim];
+            // Fill the whole matrix with random bits in one call, then map each 64-bit word to [0, 1)
+            Span<ulong> bits = MemoryMarshal.Cast<double, ulong>(projectionMatrix.AsSpan());
+            RandomNumberGenerator.Fill(MemoryMarshal.AsBytes(bits));
+            for (int i = 0; i < bits.Length; i++)
             {
-                for (int j = 0; j < dim; j++)
-                {
-                    projectionMatrix[i, j] = rand.NextDouble();
-                }
+                projectionMatrix[i] = (bits[i] >> 11) * (1.0 / (1UL << 53));
             }
         }
 
         public double[] Instantiate(string entitySignature)
         {
-            // Using tensor-based projection to simulate real-world instantiation for N-dimensional data
-            var signatureVector = entitySignature.Select(c => (double)(c % 255)).ToArray();
-            double[] projectionOutput = new double[dim];
-            for (int i = 0; i < dim; i++)
+            // Using tensor-based projection to simulate real-world instantiation for N-dimensional data.
+            // Each of the first dim UTF-16 chars is folded to its low byte (c & 0xFF), one value per char;
+            // chars below U+00FF keep the values the former c % 255 fold gave them.
+            if (entitySignature.Length < dim)
             {
-                projectionOutput[i] = 0;
-                for (int j = 0; j < dim; j++)
+                throw new ArgumentException($"Entity signature must contain at least {dim} characters.", nameof(entitySignature));
+            }
+
+            double[] signatureVector = ArrayPool<double>.Shared.Rent(dim);
+            try
+            {
+                Span<double> signatureSpan = signatureVector.AsSpan(0, dim);
+                FoldToDouble(MemoryMarshal.Cast<char, ushort>(entitySignature.AsSpan(0, dim)), signatureSpan);
+                double[] projectionOutput = new double[dim];
+                for (int i = 0; i < dim; i++)
                 {
-                    projectionOutput[i] += projectionMatrix[i, j] * signatureVector[j];
+                    projectionOutput[i] = Dot(projectionMatrix.AsSpan(i * dim, dim), signatureSpan);
                 }
+                return projectionOutput;
+            }
+            finally
+            {
+                ArrayPool<double>.Shared.Return(signatureVector, clearArray: true);
+            }
+        }
+
+        private static void FoldToDouble(ReadOnlySpan<ushort> source, Span<double> destination)
+        {
+            // (c & 0xFF) then ushort -> uint -> ulong -> double, a full Vector<ushort> at a time with a scalar tail
+            var lowByteMask = new Vector<ushort>(0xFF);
+            int i = 0;
+            for (; i <= source.Length - Vector<ushort>.Count; i += Vector<ushort>.Count)
+            {
+                Vector.Widen(new Vector<ushort>(source.Slice(i)) & lowByteMask, out Vector<uint> low, out Vector<uint> high);
+                StoreAsDouble(low, destination.Slice(i));
+                StoreAsDouble(high, destination.Slice(i + Vector<uint>.Count));
+            }
+            for (; i < source.Length; i++)
+            {
+                destination[i] = source[i] & 0xFF;
+            }
+        }
+
+        private static void StoreAsDouble(Vector<uint> values, Span<double> destination)
+        {
+            Vector.Widen(values, out Vector<ulong> low, out Vector<ulong> high);
+            Vector.ConvertToDouble(low).CopyTo(destination);
+            Vector.ConvertToDouble(high).CopyTo(destination.Slice(Vector<double>.Count));
+        }
+
+        private static double Dot(ReadOnlySpan<double> a, ReadOnlySpan<double> b)
+        {
+            // SIMD multiply-accumulate across full Vector<double> lanes, scalar loop for the tail
+            var acc = Vector<double>.Zero;
+            int i = 0;
+            for (; i <= a.Length - Vector<double>.Count; i += Vector<double>.Count)
+            {
+                acc += new Vector<double>(a.Slice(i)) * new Vector<double>(b.Slice(i));
+            }
+            double sum = Vector.Dot(acc, Vector<double>.One);
+            for (; i < a.Length; i++)
+            {
+                sum += a[i] * b[i];
             }
-            return projectionOutput;
+            return sum;
         }
     }
 
     // ------------------------------
     // ⚡ AngelNET Distributed Processing – Multi-Node Parallel Identity Execution (Supports N-dimensional)
     // ------------------------------
-    public class AngelNETNode
+    public class AngelNETNode : IDisposable
     {
+        private const int NonceSize = 12;  // AES-GCM nonce length in bytes
+        private const int TagSize = 16;    // AES-GCM authentication tag length in bytes
         private string nodeId;
         private string encryptionKey;
+        private ThreadLocal<AesGcm> aes;
 
         public AngelNETNode(string nodeId)
         {
             this.nodeId = nodeId;
             this.encryptionKey = Convert.ToBase64String(RandomNumberGenerator.GetBytes(32));
+            // AesGcm is not thread-safe, so each thread processing on this node gets its own
+            // long-lived instance; key setup happens once per node and thread
+            byte[] key = Convert.FromBase64String(encryptionKey);
+            this.aes = new ThreadLocal<AesGcm>(() => new AesGcm(key, TagSize), trackAllValues: true);
         }
 
+        public string NodeId => nodeId;
+
         public string ProcessIdentity(string signature)
         {
-            // Securely processes identity across distributed AngelNET nodes
-            using (Aes aesAlg = Aes.Create())
+            // Securely processes identity across distributed AngelNET nodes.
+            // A fresh random nonce is drawn per call; the payload is nonce || tag || ciphertext,
+            // encrypted straight into its final buffer.
+            if (aes == null)
+            {
+                throw new ObjectDisposedException(nameof(AngelNETNode));
+            }
+            byte[] plaintext = ArrayPool<byte>.Shared.Rent(Encoding.UTF8.GetMaxByteCount(signature.Length));
+            try
+            {
+                int plaintextLength = Encoding.UTF8.GetBytes(signature.AsSpan(), plaintext);
+                byte[] payload = new byte[NonceSize + TagSize + plaintextLength];
+                Span<byte> nonce = payload.AsSpan(0, NonceSize);
+                Span<byte> tag = payload.AsSpan(NonceSize, TagSize);
+                Span<byte> ciphertext = payload.AsSpan(NonceSize + TagSize);
+                RandomNumberGenerator.Fill(nonce);
+                aes.Value.Encrypt(nonce, plaintext.AsSpan(0, plaintextLength), ciphertext, tag);
+                return Convert.ToBase64String(payload);
+            }
+            finally
             {
-                aesAlg.Key = Convert.FromBase64String(encryptionKey);
-                aesAlg.IV = new byte[16];
-                ICryptoTransform encryptor = aesAlg.CreateEncryptor(aesAlg.Key, aesAlg.IV);
-                byte[] encryptedSignature = encryptor.TransformFinalBlock(Encoding.UTF8.GetBytes(signature), 0, signature.Length);
-                return Convert.ToBase64String(encryptedSignature);
+                ArrayPool<byte>.Shared.Return(plaintext, clearArray: true);
             }
         }
+
+        public void Dispose()
+        {
+            // Idempotent: the ThreadLocal cannot be queried once disposed, so only the first call releases it
+            if (aes == null)
+            {
+                return;
+            }
+            foreach (var instance in aes.Values)
+            {
+                instance.Dispose();
+            }
+            aes.Dispose();
+            aes = null;
+        }
     }
 
     // ------------------------------
@@ -201,9 +348,25 @@ namespace AngelNET
             Console.WriteLine($"🌌 Holographic Projection Vector (N-dimensional): {string.Join(",", projectionOutput)}");
 
             // 🟢 Step 5: AngelNET Distributed Identity Processing with N-dimensional Data
-            var angelNode = new AngelNETNode(nodeId: "A1");
-            var distributedOutput = angelNode.ProcessIdentity(signature);
-            Console.WriteLine($"🔄 AngelNET Node Processed Identity: {distributedOutput}");
+            var angelNodes = new[] { "A1", "A2", "A3", "A4" }.Select(id => new AngelNETNode(nodeId: id)).ToArray();
+            try
+            {
+                // Nodes are independent, so their encryption runs in parallel across all cores
+                var distributedOutputs = new string[angelNodes.Length];
+                Parallel.For(0, angelNodes.Length, new ParallelOptions { MaxDegreeOfParallelism = Environment.ProcessorCount },
+                    i => distributedOutputs[i] = angelNodes[i].ProcessIdentity(signature));
+                for (int i = 0; i < angelNodes.Length; i++)
+                {
+                    Console.WriteLine($"🔄 AngelNET Node {angelNodes[i].NodeId} Processed Identity: {distributedOutputs[i]}");
+                }
+            }
+            finally
+            {
+                foreach (var angelNode in angelNodes)
+                {
+                    angelNode.Dispose();
+                }
+            }
         }
     }
 }